@@ -11,23 +11,41 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
-import json
+import hashlib
 import os
+import socket
 import sys
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
+from urllib.parse import urlsplit
 
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 
 
 DEFAULT_BASE_URL = os.environ.get("MOBSF_URL", "http://127.0.0.1:8000")
 DEFAULT_API_KEY = os.environ.get("MOBSF_API_KEY", "mobsf_default_api_key")
-DEFAULT_POLL_DELAY_SECONDS = 5
+DEFAULT_POLL_DELAY_SECONDS = 1
+DEFAULT_MAX_POLL_DELAY_SECONDS = 15
 DEFAULT_POLL_TIMEOUT_SECONDS = 600
-PASS_TOKENS = {"pass", "passed", "compliant"}
+POLL_BACKOFF_FACTOR = 1.5
+PASS_TOKENS = frozenset({"pass", "passed", "compliant"})
+SCAN_LISTING_PAGE_SIZE = 25
+# MASVS responses meaning "no finished analysis for this hash" during reuse.
+MISSING_ANALYSIS_STATUS_CODES = (400, 404)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+RETRY_STATUS_CODES = (502, 503, 504)
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+SERVER_PROBE_DELAYS = (0.2, 1.0, 3.0)
 
 
 def _get_positive_int_env(env_name: str, default: int) -> int:
@@ -46,24 +64,26 @@ def _get_positive_int_env(env_name: str, default: int) -> int:
 
 
 POLL_DELAY_SECONDS = _get_positive_int_env("MOBSF_POLL_DELAY_SECONDS", DEFAULT_POLL_DELAY_SECONDS)
+MAX_POLL_DELAY_SECONDS = _get_positive_int_env("MOBSF_MAX_POLL_DELAY_SECONDS", DEFAULT_MAX_POLL_DELAY_SECONDS)
 POLL_TIMEOUT_SECONDS = _get_positive_int_env("MOBSF_POLL_TIMEOUT_SECONDS", DEFAULT_POLL_TIMEOUT_SECONDS)
+_STEP_SUMMARY_PATH = Path(os.environ["GITHUB_STEP_SUMMARY"]) if os.environ.get("GITHUB_STEP_SUMMARY") else None
 
 
 class MobSFError(RuntimeError):
     """Raised when the MobSF API call fails."""
 
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
 
 def _append_step_summary(summary: str) -> None:
-    if not summary:
-        return
-    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
-    if not summary_path:
+    if not summary or not _STEP_SUMMARY_PATH:
         return
+    payload = summary if summary.endswith("\n") else summary + "\n"
     try:
-        with Path(summary_path).open("a", encoding="utf-8") as handle:
-            handle.write(summary)
-            if not summary.endswith("\n"):
-                handle.write("\n")
+        with _STEP_SUMMARY_PATH.open("a", encoding="utf-8") as handle:
+            handle.write(payload)
     except OSError:
         pass
 
@@ -84,32 +104,123 @@ def _raise_for_status(response: Response, context: str) -> None:
         response.raise_for_status()
     except requests.HTTPError as exc:
         msg = f"{context} failed with status {response.status_code}: {response.text}"
-        raise MobSFError(msg) from exc
+        raise MobSFError(msg, status_code=response.status_code) from exc
+
+
+def build_session(api_key: str) -> Session:
+    """Create a keep-alive session with a pooled, retrying adapter."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUS_CODES)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Authorization": api_key, "Connection": "keep-alive"})
+    return session
+
+
+def _uses_proxy(session: Session, base_url: str) -> bool:
+    if session.proxies:
+        return True
+    return session.trust_env and bool(requests.utils.get_environ_proxies(base_url))
 
 
 def wait_for_server(session: Session, base_url: str, timeout: int = 120) -> None:
+    """
+    Wait until MobSF answers on ``base_url``.
+
+    A bare TCP connect is used to detect the listener cheaply; the HTTP check
+    only runs once something accepts connections on the port. When requests
+    would go through a proxy the TCP probe is skipped, as it cannot see past it.
+    """
+    parts = urlsplit(base_url)
+    try:
+        port = parts.port
+    except ValueError as exc:
+        raise MobSFError(f"Invalid MobSF URL {base_url!r}: {exc}") from exc
+    address = (parts.hostname or "127.0.0.1", port or (443 if parts.scheme == "https" else 80))
+    probe_socket = not _uses_proxy(session, base_url)
     start = time.monotonic()
+    attempt = 0
     while time.monotonic() - start < timeout:
-        try:
-            response = session.get(base_url, timeout=10)
-            if response.status_code == 200:
-                return
-        except requests.RequestException:
-            pass
-        time.sleep(3)
+        listening = True
+        if probe_socket:
+            try:
+                with socket.create_connection(address, timeout=1):
+                    pass
+            except OSError:
+                listening = False
+        if listening:
+            try:
+                response = session.get(base_url, timeout=5)
+                if response.status_code == 200:
+                    return
+            except requests.RequestException:
+                pass
+        time.sleep(SERVER_PROBE_DELAYS[min(attempt, len(SERVER_PROBE_DELAYS) - 1)])
+        attempt += 1
     raise MobSFError(f"MobSF server at {base_url} did not become ready within {timeout} seconds.")
 
 
-def upload_app(session: Session, base_url: str, app_path: Path) -> dict[str, Any]:
+def compute_file_hash(app_path: Path) -> str:
+    """Hash the binary the same way MobSF keys its scans (MD5 of the file)."""
+    digest = hashlib.md5(usedforsecurity=False)
+    with app_path.open("rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class HashingReader:
+    """File proxy that hashes every chunk as it is read, e.g. while uploading."""
+
+    def __init__(self, file_handle: BinaryIO) -> None:
+        self._file = file_handle
+        self._digest = hashlib.md5(usedforsecurity=False)
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._digest.update(chunk)
+        return chunk
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def upload_app(session: Session, base_url: str, app_path: Path, file_hash: Optional[str] = None) -> dict[str, Any]:
+    """
+    Upload the binary and return MobSF's upload metadata.
+
+    The scan hash MobSF reports is checked against ``file_hash`` when the
+    caller already computed it, otherwise against a digest taken while the
+    file streams out, so the binary is never read twice.
+    """
     with app_path.open("rb") as file_handle:
-        files = {"file": (app_path.name, file_handle)}
-        response = session.post(f"{base_url}/api/v1/upload", files=files, timeout=120)
+        # Stream the binary in chunks instead of buffering the whole multipart body.
+        reader = HashingReader(file_handle) if file_hash is None else None
+        body = reader if reader is not None else file_handle
+        encoder = MultipartEncoder(fields={"file": (app_path.name, body, "application/octet-stream")})
+        response = session.post(
+            f"{base_url}/api/v1/upload",
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+            timeout=120,
+        )
     _raise_for_status(response, "Upload")
     payload = response.json()
     required = {"hash", "scan_type", "file_name"}
     missing = required - payload.keys()
     if missing:
         raise MobSFError(f"Upload response missing keys: {', '.join(sorted(missing))}")
+    local_hash = reader.hexdigest() if reader is not None else file_hash
+    if payload["hash"] != local_hash:
+        raise MobSFError(f"Upload hash mismatch: MobSF reported {payload['hash']}, local file hashes to {local_hash}")
+    payload["hash"] = local_hash
     return payload
 
 
@@ -127,24 +238,91 @@ def trigger_scan(session: Session, base_url: str, upload_meta: dict[str, Any]) -
     return response.json()
 
 
+def _parse_retry_after(response: Response) -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, if any."""
+    raw_value = response.headers.get("Retry-After")
+    if not raw_value:
+        return None
+    raw_value = raw_value.strip()
+    if raw_value.isdigit():
+        return float(raw_value)
+    try:
+        retry_at = parsedate_to_datetime(raw_value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def scan_completed(scan_result: Any, scan_hash: str) -> bool:
+    """
+    Whether a ``/api/v1/scan`` response already is the finished report.
+
+    MobSF runs static analysis synchronously and answers the scan call with
+    the report, which carries the scan hash as ``md5``.
+    """
+    return isinstance(scan_result, dict) and scan_hash in (scan_result.get("md5"), scan_result.get("hash"))
+
+
+def find_existing_scan(session: Session, base_url: str, app_path: Path, file_hash: str) -> Optional[dict[str, Any]]:
+    """
+    Return upload metadata if MobSF's recent scans already list ``file_hash``.
+
+    Only the first page of the lightweight listing is checked; a listed binary
+    may still lack a finished analysis, which the caller must handle.
+    """
+    try:
+        response = session.get(f"{base_url}/api/v1/scans", params={"page": 1, "page_size": SCAN_LISTING_PAGE_SIZE}, timeout=10)
+        if response.status_code != 200:
+            return None
+        listing = response.json()
+    except (requests.RequestException, ValueError):
+        # The lookup is only an optimisation; fall back to a normal upload.
+        return None
+    entries = listing.get("content") if isinstance(listing, dict) else None
+    for entry in entries or []:
+        if isinstance(entry, dict) and entry.get("MD5") == file_hash:
+            return {
+                "hash": file_hash,
+                "scan_type": entry.get("SCAN_TYPE") or app_path.suffix.lstrip(".").lower(),
+                "file_name": entry.get("FILE_NAME") or app_path.name,
+            }
+    return None
+
+
 def wait_for_scan_completion(session: Session, base_url: str, upload_meta: dict[str, Any]) -> None:
     """
     Poll the report endpoint until the analysis artefacts are ready.
     MobSF returns the report once analysis is complete.
+
+    Only needed when the scan call did not return the finished report. The
+    delay between polls starts short and grows geometrically up to
+    MAX_POLL_DELAY_SECONDS so quick scans finish promptly while long scans do
+    not hammer the server. A ``Retry-After`` header overrides the next delay.
     """
     deadline = time.monotonic() + POLL_TIMEOUT_SECONDS
     report_endpoint = f"{base_url}/api/v1/report_json"
     payload = {"hash": upload_meta["hash"]}
+    delay = float(POLL_DELAY_SECONDS)
 
     while time.monotonic() < deadline:
+        next_delay: Optional[float] = None
         try:
             response = session.post(report_endpoint, json=payload, timeout=30)
             if response.status_code == 200:
                 # If the report is available, we can exit. The MASVS call will run afterwards.
                 return
+            next_delay = _parse_retry_after(response)
         except requests.RequestException:
             pass
-        time.sleep(POLL_DELAY_SECONDS)
+        if next_delay is None:
+            next_delay = min(delay, MAX_POLL_DELAY_SECONDS)
+            delay *= POLL_BACKOFF_FACTOR
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(next_delay, remaining))
 
     raise MobSFError(
         "Timed out waiting for MobSF to finish analysis; "
@@ -157,7 +335,8 @@ def request_masvs_report(
     base_url: str,
     upload_meta: dict[str, Any],
     level: str,
-) -> dict[str, Any]:
+) -> tuple[bytes, dict[str, Any]]:
+    """Return the MASVS report both as the raw response body and parsed."""
     endpoint = f"{base_url}/api/v1/masvs"
     payload = {
         "scan_type": upload_meta["scan_type"],
@@ -170,33 +349,33 @@ def request_masvs_report(
         # Fall back to form-encoded for older MobSF releases.
         response = session.post(endpoint, data=payload, timeout=60)
     _raise_for_status(response, "MASVS report")
-    return response.json()
+    return response.content, response.json()
 
 
-def parse_masvs(data: dict[str, Any], level: str) -> MASVSResult:
-    controls = data.get("controls") or data.get("masvs_controls") or []
-    failed: list[dict[str, Any]] = []
-    passed = 0
-
-    for entry in controls:
-        status_raw = entry.get("status") or entry.get("value") or ""
-        status = str(status_raw).strip().lower()
-        if status in PASS_TOKENS:
-            passed += 1
-        elif status:
-            failed.append(entry)
-        else:
-            # Assume failure if status is missing or unknown.
-            failed.append(entry)
+def _control_status(entry: dict[str, Any]) -> str:
+    get = entry.get
+    status = get("status") or get("value")
+    if not status:
+        return ""
+    return (status if isinstance(status, str) else str(status)).strip().lower()
+
 
-    # Some MobSF versions return an aggregate dictionary instead.
-    aggregate = data.get("summary") or data.get("masvs_summary") or {}
-    if not controls and aggregate:
+def parse_masvs(data: dict[str, Any], level: str) -> MASVSResult:
+    controls = data.get("controls") or data.get("masvs_controls")
+    if not controls:
+        # Some MobSF versions return an aggregate dictionary instead.
+        aggregate = data.get("summary") or data.get("masvs_summary") or {}
         failed_controls = aggregate.get("failed") or aggregate.get("non_compliant") or []
         passed = aggregate.get("pass", 0) or aggregate.get("passed", 0)
-        failed = failed_controls if isinstance(failed_controls, list) else []
+        return MASVSResult(
+            level=level,
+            passed=passed,
+            failed=failed_controls if isinstance(failed_controls, list) else [],
+        )
 
-    return MASVSResult(level=level, passed=passed, failed=failed)
+    # Missing or unknown statuses count as failures.
+    failed = [entry for entry in controls if _control_status(entry) not in PASS_TOKENS]
+    return MASVSResult(level=level, passed=len(controls) - len(failed), failed=failed)
 
 
 def render_failures(failures: Iterable[dict[str, Any]]) -> str:
@@ -209,48 +388,194 @@ def render_failures(failures: Iterable[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def run_masvs_audit(
+def _report_output_path(output_path: Optional[Path], app_path: Path, batch: bool) -> Optional[Path]:
+    if output_path is None or not batch:
+        return output_path
+    return output_path.with_name(f"{output_path.stem}-{app_path.name}{output_path.suffix}")
+
+
+def _audit_app(
+    api_key: str,
+    base_url: str,
     app_path: Path,
     level: str,
     *,
+    output_path: Optional[Path],
+    force_rescan: bool,
+) -> MASVSResult:
+    # Each worker gets its own session; requests does not promise thread safety.
+    with build_session(api_key) as session:
+        return _audit_app_with_session(session, base_url, app_path, level, output_path=output_path, force_rescan=force_rescan)
+
+
+def _audit_app_with_session(
+    session: Session,
+    base_url: str,
+    app_path: Path,
+    level: str,
+    *,
+    output_path: Optional[Path],
+    force_rescan: bool,
+) -> MASVSResult:
+    tag = f"[{app_path.name}]"
+
+    upload_meta = None
+    masvs_report = None
+    file_hash = None
+    if not force_rescan:
+        file_hash = compute_file_hash(app_path)
+        upload_meta = find_existing_scan(session, base_url, app_path, file_hash)
+    if upload_meta:
+        try:
+            masvs_report = request_masvs_report(session, base_url, upload_meta, level)
+        except MobSFError as exc:
+            if exc.status_code not in MISSING_ANALYSIS_STATUS_CODES:
+                raise
+            print(f"♻️  {tag} {upload_meta['file_name']} is already uploaded but has no finished analysis; rescanning.")
+        else:
+            print(f"♻️  {tag} Reusing existing analysis of {upload_meta['file_name']} (hash: {upload_meta['hash']})")
+
+    if masvs_report is None:
+        if not upload_meta:
+            upload_meta = upload_app(session, base_url, app_path, file_hash)
+            print(f"⬆️  {tag} Uploaded {upload_meta['file_name']} (hash: {upload_meta['hash']})")
+
+        print(f"🔍 {tag} MobSF analysis started, waiting for completion...")
+        scan_result = trigger_scan(session, base_url, upload_meta)
+        if not scan_completed(scan_result, upload_meta["hash"]):
+            wait_for_scan_completion(session, base_url, upload_meta)
+        masvs_report = request_masvs_report(session, base_url, upload_meta, level)
+
+    masvs_bytes, masvs_raw = masvs_report
+    if output_path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Persist MobSF's response as-is rather than re-serializing the parsed report.
+        output_path.write_bytes(masvs_bytes)
+        print(f"📝 {tag} Raw MASVS report saved to {output_path}")
+    return parse_masvs(masvs_raw, level)
+
+
+def run_masvs_audit_batch(
+    app_paths: list[Path],
+    level: str,
+    *,
     fail_on_violation: bool,
     base_url: str,
     api_key: str,
     output_path: Optional[Path] = None,
-) -> MASVSResult:
-    if not app_path.exists():
-        raise MobSFError(f"App binary not found at {app_path}")
-
-    session = requests.Session()
-    session.headers.update({"Authorization": api_key})
+    force_rescan: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[Path, MASVSResult]:
+    """
+    Audit several binaries concurrently against one MobSF instance.
 
-    wait_for_server(session, base_url)
+    At most ``max_workers`` binaries are uploaded and analysed at a time, each
+    worker with its own session. Every binary is audited even if another one
+    fails; failures are reported together afterwards. With several binaries
+    and an ``output_path``, each report is written next to it with the binary
+    name appended to the stem.
+    """
+    if not app_paths:
+        raise MobSFError("No app binaries were given to audit.")
+    for app_path in app_paths:
+        if not app_path.exists():
+            raise MobSFError(f"App binary not found at {app_path}")
+    names = [app_path.name for app_path in app_paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        # Reports, log prefixes and summary rows are keyed by file name.
+        raise MobSFError(f"App binaries must have distinct file names; duplicated: {', '.join(duplicates)}")
+
+    with build_session(api_key) as session:
+        wait_for_server(session, base_url)
     print(f"✅ MobSF server is reachable at {base_url}")
 
-    upload_meta = upload_app(session, base_url, app_path)
-    print(f"⬆️  Uploaded {upload_meta['file_name']} (hash: {upload_meta['hash']})")
+    batch = len(app_paths) > 1
+    results: dict[Path, MASVSResult] = {}
+    errors: dict[Path, Exception] = {}
+    with ThreadPoolExecutor(max_workers=min(len(app_paths), max_workers)) as executor:
+        futures = {
+            executor.submit(
+                _audit_app,
+                api_key,
+                base_url,
+                app_path,
+                level,
+                output_path=_report_output_path(output_path, app_path, batch),
+                force_rescan=force_rescan,
+            ): app_path
+            for app_path in app_paths
+        }
+        for future in as_completed(futures):
+            app_path = futures[future]
+            try:
+                results[app_path] = future.result()
+            except (MobSFError, requests.RequestException) as exc:
+                errors[app_path] = exc
+
+    if errors and not batch:
+        raise errors[app_paths[0]]
+
+    ordered = {app_path: results[app_path] for app_path in app_paths if app_path in results}
+    violations = []
+    for app_path, result in ordered.items():
+        prefix = f"[{app_path.name}] " if batch else ""
+        print(f"📋 {prefix}MASVS level {result.level} summary: {result.passed} controls passed, {len(result.failed)} controls failed.")
+        if result.failed:
+            violations.append(app_path.name)
+            print("❌ Non-compliant controls detected:")
+            print(render_failures(result.failed))
+        else:
+            print("✅ All MASVS controls passed.")
+
+    if errors:
+        details = []
+        for app_path in app_paths:
+            exc = errors.get(app_path)
+            if isinstance(exc, requests.RequestException):
+                details.append(f"{app_path.name}: Networking failure while communicating with MobSF: {exc}")
+            elif exc is not None:
+                details.append(f"{app_path.name}: {exc}")
+        if violations and fail_on_violation:
+            details.append(f"policy violations in: {', '.join(violations)}")
+        raise MobSFError(f"MobSF audit failed for {len(errors)} of {len(app_paths)} binaries; " + "; ".join(details))
+    if violations and fail_on_violation:
+        if batch:
+            raise MobSFError(f"MASVS compliance check failed due to policy violations in: {', '.join(violations)}.")
+        raise MobSFError("MASVS compliance check failed due to policy violations.")
+    return ordered
 
-    trigger_scan(session, base_url, upload_meta)
-    print("🔍 MobSF analysis started, waiting for completion...")
-    wait_for_scan_completion(session, base_url, upload_meta)
 
-    masvs_raw = request_masvs_report(session, base_url, upload_meta, level)
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(masvs_raw, indent=2))
-        print(f"📝 Raw MASVS report saved to {output_path}")
-    result = parse_masvs(masvs_raw, level)
+def run_masvs_audit(
+    app_path: Path,
+    level: str,
+    *,
+    fail_on_violation: bool,
+    base_url: str,
+    api_key: str,
+    output_path: Optional[Path] = None,
+    force_rescan: bool = False,
+) -> MASVSResult:
+    results = run_masvs_audit_batch(
+        [app_path],
+        level,
+        fail_on_violation=fail_on_violation,
+        base_url=base_url,
+        api_key=api_key,
+        output_path=output_path,
+        force_rescan=force_rescan,
+    )
+    return results[app_path]
 
-    print(f"📋 MASVS level {result.level} summary: {result.passed} controls passed, {len(result.failed)} controls failed.")
 
-    if result.failed:
-        print("❌ Non-compliant controls detected:")
-        print(render_failures(result.failed))
-        if fail_on_violation:
-            raise MobSFError("MASVS compliance check failed due to policy violations.")
-    else:
-        print("✅ All MASVS controls passed.")
-    return result
+def _positive_int(value: str) -> int:
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not an integer") from None
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {parsed}")
+    return parsed
 
 
 def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -258,7 +583,8 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--app",
         required=True,
-        help="Path to the mobile binary (APK, AAB, or IPA) to analyse.",
+        action="append",
+        help="Path to the mobile binary (APK, AAB, or IPA) to analyse. Repeat to audit several binaries.",
     )
     parser.add_argument(
         "--masvs-level",
@@ -285,21 +611,34 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         "--output",
         help="Optional path to write the raw MASVS JSON output.",
     )
+    parser.add_argument(
+        "--force-rescan",
+        action="store_true",
+        help="Upload and rescan the binary even if MobSF already has a report for its hash.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum number of binaries uploaded and analysed concurrently (default: {DEFAULT_MAX_WORKERS}).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = parse_args(argv)
-    app_path = Path(args.app).expanduser().resolve()
+    app_paths = [Path(app).expanduser().resolve() for app in args.app]
     output_path = Path(args.output).expanduser().resolve() if args.output else None
     try:
-        result = run_masvs_audit(
-            app_path=app_path,
-            level=args.masvs_level,
+        results = run_masvs_audit_batch(
+            app_paths,
+            args.masvs_level,
             fail_on_violation=args.fail_on_violation,
             base_url=args.mobsf_url,
             api_key=args.api_key,
             output_path=output_path,
+            force_rescan=args.force_rescan,
+            max_workers=args.max_workers,
         )
     except MobSFError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
@@ -323,18 +662,24 @@ def main(argv: Optional[list[str]] = None) -> int:
         )
         _append_step_summary(summary)
         return 1
+    batch = len(results) > 1
     status_line = "- Status: ✅ Success"
-    if result.failed:
+    if any(result.failed for result in results.values()):
         status_line = "- Status: ⚠️ Completed with warnings"
     summary_lines = [
         "## MobSF MASVS scan",
         status_line,
-        f"- MASVS level: {result.level}",
-        f"- Passed controls: {result.passed}",
-        f"- Failed controls: {len(result.failed)}",
+        f"- MASVS level: {args.masvs_level}",
     ]
-    if output_path:
-        summary_lines.append(f"- Report: `{output_path}`")
+    for app_path, result in results.items():
+        if batch:
+            summary_lines.append(f"- `{app_path.name}`: {result.passed} passed, {len(result.failed)} failed")
+        else:
+            summary_lines.append(f"- Passed controls: {result.passed}")
+            summary_lines.append(f"- Failed controls: {len(result.failed)}")
+        report_path = _report_output_path(output_path, app_path, batch)
+        if report_path:
+            summary_lines.append(f"{'  ' if batch else ''}- Report: `{report_path}`")
     _append_step_summary("\n".join(summary_lines))
     return 0
 
@@ -0,0 +1,622 @@
+"""
+Unit tests for the MobSF CI helper.
+
+Run with: python3 -m unittest discover -s .github/scripts -p "test_*.py"
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import tempfile
+import time
+import unittest
+from email.utils import formatdate
+from pathlib import Path
+from unittest import mock
+
+import requests
+from requests import Response
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+import mobsf_ci
+
+
+def _response(status_code: int = 200, headers: dict[str, str] | None = None, body: bytes = b"") -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = body
+    return response
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so polling loops run instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def patch(self) -> mock._patch:
+        return mock.patch.multiple(mobsf_ci.time, monotonic=self.monotonic, sleep=self.sleep)
+
+
+class ParseRetryAfterTests(unittest.TestCase):
+    def test_missing_header(self) -> None:
+        self.assertIsNone(mobsf_ci._parse_retry_after(_response(404)))
+
+    def test_delay_seconds(self) -> None:
+        self.assertEqual(mobsf_ci._parse_retry_after(_response(503, {"Retry-After": " 7 "})), 7.0)
+
+    def test_http_date(self) -> None:
+        header = formatdate(time.time() + 30, usegmt=True)
+        delay = mobsf_ci._parse_retry_after(_response(503, {"Retry-After": header}))
+        self.assertIsNotNone(delay)
+        self.assertTrue(25 <= delay <= 31, delay)
+
+    def test_past_http_date_is_clamped(self) -> None:
+        header = formatdate(time.time() - 3600, usegmt=True)
+        self.assertEqual(mobsf_ci._parse_retry_after(_response(503, {"Retry-After": header})), 0.0)
+
+    def test_unparseable_header(self) -> None:
+        self.assertIsNone(mobsf_ci._parse_retry_after(_response(503, {"Retry-After": "soon"})))
+
+
+class WaitForScanCompletionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        for patcher in (
+            self.clock.patch(),
+            mock.patch.object(mobsf_ci, "POLL_DELAY_SECONDS", 1),
+            mock.patch.object(mobsf_ci, "MAX_POLL_DELAY_SECONDS", 4),
+            mock.patch.object(mobsf_ci, "POLL_TIMEOUT_SECONDS", 60),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session = mock.Mock()
+
+    def _wait(self) -> None:
+        mobsf_ci.wait_for_scan_completion(self.session, "http://mobsf", {"hash": "abc"})
+
+    def test_backoff_grows_geometrically_up_to_cap(self) -> None:
+        self.session.post.side_effect = [_response(404)] * 5 + [_response(200)]
+        self._wait()
+        self.assertEqual(self.clock.sleeps, [1.0, 1.5, 2.25, 3.375, 4])
+        self.session.post.assert_called_with("http://mobsf/api/v1/report_json", json={"hash": "abc"}, timeout=30)
+
+    def test_retry_after_overrides_next_delay(self) -> None:
+        self.session.post.side_effect = [
+            _response(404),
+            _response(503, {"Retry-After": "10"}),
+            _response(404),
+            _response(200),
+        ]
+        self._wait()
+        self.assertEqual(self.clock.sleeps, [1.0, 10.0, 1.5])
+
+    def test_request_errors_back_off(self) -> None:
+        self.session.post.side_effect = [requests.ConnectionError("refused"), _response(200)]
+        self._wait()
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_deadline_clamps_last_sleep_and_raises(self) -> None:
+        self.session.post.return_value = _response(404)
+        with mock.patch.object(mobsf_ci, "POLL_TIMEOUT_SECONDS", 10), self.assertRaisesRegex(mobsf_ci.MobSFError, "Timed out"):
+            self._wait()
+        self.assertEqual(self.clock.sleeps, [1.0, 1.5, 2.25, 3.375, 1.875])
+        self.assertEqual(self.clock.now, 10)
+
+
+class ScanCompletedTests(unittest.TestCase):
+    def test_report_with_matching_hash(self) -> None:
+        self.assertTrue(mobsf_ci.scan_completed({"md5": "abc", "file_name": "app.apk"}, "abc"))
+
+    def test_acknowledgement_without_report(self) -> None:
+        self.assertFalse(mobsf_ci.scan_completed({"status": "ok"}, "abc"))
+        self.assertFalse(mobsf_ci.scan_completed([], "abc"))
+
+
+class AuditAppTestCase(unittest.TestCase):
+    """Runs _audit_app_with_session with every MobSF call mocked out."""
+
+    upload_meta = {"hash": "abc", "scan_type": "apk", "file_name": "app.apk"}
+
+    def setUp(self) -> None:
+        self.mocks: dict[str, mock.Mock] = {}
+        for name in ("compute_file_hash", "find_existing_scan", "upload_app", "trigger_scan", "wait_for_scan_completion", "request_masvs_report"):
+            patcher = mock.patch.object(mobsf_ci, name)
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mocks["compute_file_hash"].return_value = "abc"
+        self.mocks["find_existing_scan"].return_value = None
+        self.mocks["upload_app"].return_value = dict(self.upload_meta)
+        self.mocks["trigger_scan"].return_value = {"md5": "abc"}
+        self.mocks["request_masvs_report"].return_value = (b"{}", {"controls": [{"status": "pass"}]})
+
+    def _audit(self, force_rescan: bool = False) -> mobsf_ci.MASVSResult:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return mobsf_ci._audit_app_with_session(
+                mock.Mock(), "http://mobsf", Path("app.apk"), "L2", output_path=None, force_rescan=force_rescan
+            )
+
+
+class ScanCompletionTests(AuditAppTestCase):
+    def test_synchronous_scan_skips_polling(self) -> None:
+        result = self._audit(force_rescan=True)
+        self.assertEqual(result.passed, 1)
+        self.mocks["trigger_scan"].assert_called_once()
+        self.mocks["wait_for_scan_completion"].assert_not_called()
+
+    def test_acknowledged_scan_falls_back_to_polling(self) -> None:
+        self.mocks["trigger_scan"].return_value = {"status": "queued"}
+        self._audit(force_rescan=True)
+        self.mocks["wait_for_scan_completion"].assert_called_once()
+
+
+class FindExistingScanTests(unittest.TestCase):
+    def _find(self, session: mock.Mock) -> dict[str, str] | None:
+        return mobsf_ci.find_existing_scan(session, "http://mobsf", Path("x.apk"), "abc")
+
+    def _session(self, response: Response) -> mock.Mock:
+        session = mock.Mock()
+        session.get.return_value = response
+        return session
+
+    def test_listed_hash(self) -> None:
+        listing = b'{"content": [{"MD5": "other"}, {"MD5": "abc", "SCAN_TYPE": "apk", "FILE_NAME": "app.apk"}]}'
+        self.assertEqual(self._find(self._session(_response(body=listing))), {"hash": "abc", "scan_type": "apk", "file_name": "app.apk"})
+
+    def test_listed_hash_without_metadata_uses_binary(self) -> None:
+        listing = b'{"content": [{"MD5": "abc"}]}'
+        self.assertEqual(self._find(self._session(_response(body=listing))), {"hash": "abc", "scan_type": "apk", "file_name": "x.apk"})
+
+    def test_unlisted_hash(self) -> None:
+        self.assertIsNone(self._find(self._session(_response(body=b'{"content": [{"MD5": "other"}]}'))))
+
+    def test_listing_unavailable(self) -> None:
+        self.assertIsNone(self._find(self._session(_response(404))))
+
+    def test_malformed_listing(self) -> None:
+        self.assertIsNone(self._find(self._session(_response(body=b"<html>"))))
+
+    def test_request_errors_fall_back(self) -> None:
+        for error in (
+            requests.Timeout("read timed out"),
+            requests.ConnectionError("refused"),
+            requests.exceptions.RetryError("too many 503 error responses"),
+        ):
+            with self.subTest(error=type(error).__name__):
+                session = mock.Mock()
+                session.get.side_effect = error
+                self.assertIsNone(self._find(session))
+
+
+class ReuseExistingScanTests(AuditAppTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocks["find_existing_scan"].return_value = dict(self.upload_meta)
+
+    def test_listed_binary_reuses_masvs_report(self) -> None:
+        self._audit()
+        self.mocks["request_masvs_report"].assert_called_once()
+        self.mocks["upload_app"].assert_not_called()
+        self.mocks["trigger_scan"].assert_not_called()
+
+    def test_missing_analysis_rescans_without_upload(self) -> None:
+        for status_code in mobsf_ci.MISSING_ANALYSIS_STATUS_CODES:
+            with self.subTest(status_code=status_code):
+                self.mocks["trigger_scan"].reset_mock()
+                self.mocks["request_masvs_report"].side_effect = [
+                    mobsf_ci.MobSFError("MASVS report failed", status_code=status_code),
+                    (b"{}", {"controls": []}),
+                ]
+                self._audit()
+                self.mocks["upload_app"].assert_not_called()
+                self.mocks["trigger_scan"].assert_called_once()
+
+    def test_other_masvs_errors_propagate(self) -> None:
+        for status_code in (401, 500):
+            with self.subTest(status_code=status_code):
+                self.mocks["request_masvs_report"].side_effect = mobsf_ci.MobSFError("MASVS report failed", status_code=status_code)
+                with self.assertRaises(mobsf_ci.MobSFError):
+                    self._audit()
+                self.mocks["trigger_scan"].assert_not_called()
+
+    def test_unlisted_binary_uploads_with_known_hash(self) -> None:
+        self.mocks["find_existing_scan"].return_value = None
+        self._audit()
+        self.mocks["upload_app"].assert_called_once_with(mock.ANY, "http://mobsf", Path("app.apk"), "abc")
+
+    def test_force_rescan_skips_lookup(self) -> None:
+        self._audit(force_rescan=True)
+        self.mocks["compute_file_hash"].assert_not_called()
+        self.mocks["find_existing_scan"].assert_not_called()
+        self.mocks["upload_app"].assert_called_once_with(mock.ANY, "http://mobsf", Path("app.apk"), None)
+
+
+class HashingReaderTests(unittest.TestCase):
+    def test_digest_matches_streamed_multipart_body(self) -> None:
+        payload = bytes(range(256)) * 1024
+        with tempfile.TemporaryDirectory() as tmp:
+            app_path = Path(tmp) / "app.apk"
+            app_path.write_bytes(payload)
+            with app_path.open("rb") as file_handle:
+                reader = mobsf_ci.HashingReader(file_handle)
+                encoder = MultipartEncoder(fields={"file": (app_path.name, reader, "application/octet-stream")})
+                self.assertGreater(encoder.len, len(payload))
+                body = b"".join(iter(lambda: encoder.read(8192), b""))
+            self.assertIn(payload, body)
+            self.assertEqual(reader.hexdigest(), hashlib.md5(payload).hexdigest())
+            self.assertEqual(mobsf_ci.compute_file_hash(app_path), reader.hexdigest())
+
+
+class UploadAppTests(unittest.TestCase):
+    payload = b"apk bytes" * 1000
+    local_hash = hashlib.md5(payload).hexdigest()
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.app_path = Path(tmp.name) / "app.apk"
+        self.app_path.write_bytes(self.payload)
+        self.bodies: list[bytes] = []
+
+    def _session(self, server_hash: str) -> mock.Mock:
+        def post(url: str, *, data: MultipartEncoder, headers: dict[str, str], timeout: int) -> Response:
+            # Drain the encoder like requests would while sending the body.
+            self.bodies.append(data.read())
+            body = {"hash": server_hash, "scan_type": "apk", "file_name": self.app_path.name}
+            return _response(body=json.dumps(body).encode())
+
+        session = mock.Mock()
+        session.post.side_effect = post
+        return session
+
+    def test_streamed_digest_is_used(self) -> None:
+        meta = mobsf_ci.upload_app(self._session(self.local_hash), "http://mobsf", self.app_path)
+        self.assertEqual(meta["hash"], self.local_hash)
+        self.assertIn(self.payload, self.bodies[0])
+
+    def test_streamed_digest_mismatch(self) -> None:
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, f"Upload hash mismatch: MobSF reported deadbeef, local file hashes to {self.local_hash}"):
+            mobsf_ci.upload_app(self._session("deadbeef"), "http://mobsf", self.app_path)
+
+    def test_precomputed_hash_skips_rehashing(self) -> None:
+        with mock.patch.object(mobsf_ci, "HashingReader") as reader:
+            meta = mobsf_ci.upload_app(self._session(self.local_hash), "http://mobsf", self.app_path, self.local_hash)
+        reader.assert_not_called()
+        self.assertEqual(meta["hash"], self.local_hash)
+
+    def test_precomputed_hash_mismatch(self) -> None:
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "Upload hash mismatch: MobSF reported deadbeef, local file hashes to cafe"):
+            mobsf_ci.upload_app(self._session("deadbeef"), "http://mobsf", self.app_path, "cafe")
+
+    def test_missing_keys(self) -> None:
+        session = mock.Mock()
+        session.post.return_value = _response(body=b'{"hash": "abc"}')
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "missing keys: file_name, scan_type"):
+            mobsf_ci.upload_app(session, "http://mobsf", self.app_path, "abc")
+
+
+class WaitForServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.connect = mock.MagicMock()
+        self.environ_proxies = mock.Mock(return_value={})
+        for patcher in (
+            self.clock.patch(),
+            mock.patch.object(mobsf_ci.socket, "create_connection", self.connect),
+            mock.patch("requests.utils.get_environ_proxies", self.environ_proxies),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session = mock.Mock(proxies={}, trust_env=True)
+        self.session.get.return_value = _response(200)
+
+    def test_probes_socket_until_listening(self) -> None:
+        self.connect.side_effect = [OSError("refused")] * 4 + [mock.MagicMock()]
+        mobsf_ci.wait_for_server(self.session, "http://127.0.0.1:8000")
+        self.assertEqual(self.clock.sleeps, [0.2, 1.0, 3.0, 3.0])
+        self.connect.assert_called_with(("127.0.0.1", 8000), timeout=1)
+        self.session.get.assert_called_once_with("http://127.0.0.1:8000", timeout=5)
+
+    def test_retries_http_check_once_listening(self) -> None:
+        self.session.get.side_effect = [_response(502), requests.ConnectionError("reset"), _response(200)]
+        mobsf_ci.wait_for_server(self.session, "http://mobsf:8000")
+        self.assertEqual(self.session.get.call_count, 3)
+        self.assertEqual(self.clock.sleeps, [0.2, 1.0])
+
+    def test_default_port_follows_scheme(self) -> None:
+        mobsf_ci.wait_for_server(self.session, "https://mobsf.example")
+        self.connect.assert_called_once_with(("mobsf.example", 443), timeout=1)
+
+    def test_environment_proxy_skips_socket_probe(self) -> None:
+        self.environ_proxies.return_value = {"http": "http://proxy:3128"}
+        mobsf_ci.wait_for_server(self.session, "http://mobsf:8000")
+        self.connect.assert_not_called()
+        self.session.get.assert_called_once()
+
+    def test_session_proxy_skips_socket_probe(self) -> None:
+        self.session.proxies = {"https": "http://proxy:3128"}
+        mobsf_ci.wait_for_server(self.session, "https://mobsf.example")
+        self.connect.assert_not_called()
+
+    def test_environment_proxies_ignored_without_trust_env(self) -> None:
+        self.session.trust_env = False
+        self.environ_proxies.return_value = {"http": "http://proxy:3128"}
+        mobsf_ci.wait_for_server(self.session, "http://mobsf:8000")
+        self.connect.assert_called_once()
+
+    def test_invalid_port(self) -> None:
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "Invalid MobSF URL"):
+            mobsf_ci.wait_for_server(self.session, "http://mobsf:notaport")
+
+    def test_times_out_without_http_check(self) -> None:
+        self.connect.side_effect = OSError("refused")
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "did not become ready within 5 seconds"):
+            mobsf_ci.wait_for_server(self.session, "http://mobsf:8000", timeout=5)
+        self.session.get.assert_not_called()
+
+
+class ControlStatusTests(unittest.TestCase):
+    def test_normalises_status(self) -> None:
+        self.assertEqual(mobsf_ci._control_status({"status": " PASS "}), "pass")
+
+    def test_falls_back_to_value(self) -> None:
+        self.assertEqual(mobsf_ci._control_status({"status": "", "value": "Compliant"}), "compliant")
+
+    def test_non_string_status(self) -> None:
+        self.assertEqual(mobsf_ci._control_status({"status": True}), "true")
+
+    def test_missing_status(self) -> None:
+        self.assertEqual(mobsf_ci._control_status({}), "")
+
+
+class ParseMasvsTests(unittest.TestCase):
+    def test_controls(self) -> None:
+        controls = [
+            {"control": "A", "status": "PASS"},
+            {"control": "B", "value": " Compliant "},
+            {"control": "C", "status": "fail"},
+            {"control": "D"},
+            {"control": "E", "status": True},
+        ]
+        result = mobsf_ci.parse_masvs({"controls": controls}, "L2")
+        self.assertEqual(result.level, "L2")
+        self.assertEqual(result.passed, 2)
+        self.assertEqual([entry["control"] for entry in result.failed], ["C", "D", "E"])
+        self.assertFalse(result.is_compliant)
+
+    def test_masvs_controls_key(self) -> None:
+        result = mobsf_ci.parse_masvs({"masvs_controls": [{"status": "passed"}]}, "L1")
+        self.assertEqual(result.passed, 1)
+        self.assertTrue(result.is_compliant)
+
+    def test_aggregate_summary(self) -> None:
+        data = {"summary": {"passed": 4, "failed": [{"id": "MSTG-1"}]}}
+        result = mobsf_ci.parse_masvs(data, "L2")
+        self.assertEqual(result.passed, 4)
+        self.assertEqual(result.failed, [{"id": "MSTG-1"}])
+
+    def test_aggregate_ignored_when_controls_present(self) -> None:
+        data = {"controls": [{"status": "pass"}], "summary": {"passed": 9, "failed": [{"id": "X"}]}}
+        result = mobsf_ci.parse_masvs(data, "L2")
+        self.assertEqual((result.passed, result.failed), (1, []))
+
+    def test_aggregate_with_non_list_failures(self) -> None:
+        result = mobsf_ci.parse_masvs({"masvs_summary": {"pass": 2, "non_compliant": 3}}, "L2")
+        self.assertEqual(result.passed, 2)
+        self.assertEqual(result.failed, [])
+
+    def test_empty_response(self) -> None:
+        result = mobsf_ci.parse_masvs({}, "L2")
+        self.assertEqual((result.passed, result.failed), (0, []))
+
+
+class ReportOutputPathTests(unittest.TestCase):
+    def test_no_output(self) -> None:
+        self.assertIsNone(mobsf_ci._report_output_path(None, Path("app.apk"), batch=True))
+
+    def test_single_binary_keeps_path(self) -> None:
+        output = Path("/tmp/artifacts/masvs-report.json")
+        self.assertEqual(mobsf_ci._report_output_path(output, Path("app.apk"), batch=False), output)
+
+    def test_batch_appends_binary_name(self) -> None:
+        output = Path("/tmp/artifacts/masvs-report.json")
+        apk = mobsf_ci._report_output_path(output, Path("/build/app-release.apk"), batch=True)
+        aab = mobsf_ci._report_output_path(output, Path("/build/app-release.aab"), batch=True)
+        self.assertEqual(apk, Path("/tmp/artifacts/masvs-report-app-release.apk.json"))
+        self.assertEqual(aab, Path("/tmp/artifacts/masvs-report-app-release.aab.json"))
+
+
+def _result(passed: int, failed: int = 0) -> mobsf_ci.MASVSResult:
+    return mobsf_ci.MASVSResult(level="L2", passed=passed, failed=[{"control": f"C{i}"} for i in range(failed)])
+
+
+class RunMasvsAuditBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        for target in ("build_session", "wait_for_server"):
+            patcher = mock.patch.object(mobsf_ci, target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _app(self, name: str, directory: str = "") -> Path:
+        app_path = self.tmp / directory / name
+        app_path.parent.mkdir(parents=True, exist_ok=True)
+        app_path.write_bytes(b"binary")
+        return app_path
+
+    def _run(self, app_paths: list[Path], outcomes: dict[str, object], **kwargs: object) -> dict[Path, mobsf_ci.MASVSResult]:
+        def audit(api_key: str, base_url: str, app_path: Path, level: str, **_: object) -> mobsf_ci.MASVSResult:
+            outcome = outcomes[app_path.name]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        kwargs.setdefault("fail_on_violation", True)
+        self.audit_mock = mock.Mock(side_effect=audit)
+        with mock.patch.object(mobsf_ci, "_audit_app", self.audit_mock), contextlib.redirect_stdout(io.StringIO()):
+            return mobsf_ci.run_masvs_audit_batch(app_paths, "L2", base_url="http://mobsf", api_key="key", **kwargs)
+
+    def test_results_keep_input_order(self) -> None:
+        apps = [self._app("b.ipa"), self._app("a.apk")]
+        results = self._run(apps, {"a.apk": _result(3), "b.ipa": _result(2)})
+        self.assertEqual(list(results), apps)
+        self.assertEqual(results[apps[0]].passed, 2)
+
+    def test_batch_reports_get_distinct_paths(self) -> None:
+        apps = [self._app("a.apk"), self._app("b.ipa")]
+        self._run(apps, {"a.apk": _result(1), "b.ipa": _result(1)}, output_path=self.tmp / "masvs.json")
+        written = sorted(call.kwargs["output_path"].name for call in self.audit_mock.call_args_list)
+        self.assertEqual(written, ["masvs-a.apk.json", "masvs-b.ipa.json"])
+
+    def test_collects_every_failure(self) -> None:
+        apps = [self._app("a.apk"), self._app("b.ipa"), self._app("c.aab")]
+        outcomes = {
+            "a.apk": mobsf_ci.MobSFError("Upload failed with status 500"),
+            "b.ipa": requests.ConnectionError("connection refused"),
+            "c.aab": _result(4),
+        }
+        with self.assertRaises(mobsf_ci.MobSFError) as ctx:
+            self._run(apps, outcomes)
+        message = str(ctx.exception)
+        self.assertIn("failed for 2 of 3 binaries", message)
+        self.assertIn("a.apk: Upload failed with status 500", message)
+        self.assertIn("b.ipa: Networking failure while communicating with MobSF: connection refused", message)
+        self.assertNotIn("c.aab", message)
+        self.assertEqual(self.audit_mock.call_count, 3)
+
+    def test_failures_and_violations_reported_together(self) -> None:
+        apps = [self._app("a.apk"), self._app("b.ipa")]
+        outcomes = {"a.apk": mobsf_ci.MobSFError("Scan failed"), "b.ipa": _result(1, failed=2)}
+        with self.assertRaises(mobsf_ci.MobSFError) as ctx:
+            self._run(apps, outcomes)
+        self.assertIn("a.apk: Scan failed; policy violations in: b.ipa", str(ctx.exception))
+
+    def test_violations_fail_the_batch(self) -> None:
+        apps = [self._app("a.apk"), self._app("b.ipa")]
+        with self.assertRaises(mobsf_ci.MobSFError) as ctx:
+            self._run(apps, {"a.apk": _result(1, failed=1), "b.ipa": _result(1, failed=1)})
+        self.assertEqual(str(ctx.exception), "MASVS compliance check failed due to policy violations in: a.apk, b.ipa.")
+
+    def test_violations_tolerated_without_fail_on_violation(self) -> None:
+        app = self._app("a.apk")
+        results = self._run([app], {"a.apk": _result(1, failed=1)}, fail_on_violation=False)
+        self.assertEqual(len(results[app].failed), 1)
+
+    def test_single_binary_reraises_original_error(self) -> None:
+        error = requests.ConnectionError("connection refused")
+        with self.assertRaises(requests.ConnectionError) as ctx:
+            self._run([self._app("a.apk")], {"a.apk": error})
+        self.assertIs(ctx.exception, error)
+
+    def test_rejects_duplicate_file_names(self) -> None:
+        apps = [self._app("app-release.apk", "free"), self._app("app-release.apk", "paid")]
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "distinct file names; duplicated: app-release.apk"):
+            self._run(apps, {})
+        self.audit_mock.assert_not_called()
+
+    def test_rejects_empty_batch(self) -> None:
+        with self.assertRaisesRegex(mobsf_ci.MobSFError, "No app binaries"):
+            self._run([], {})
+
+    def test_pool_sized_by_max_workers(self) -> None:
+        apps = [self._app(f"app{i}.apk") for i in range(12)]
+        executor = mock.MagicMock(wraps=mobsf_ci.ThreadPoolExecutor)
+        with mock.patch.object(mobsf_ci, "ThreadPoolExecutor", executor):
+            self._run(apps, {app.name: _result(1) for app in apps}, max_workers=10)
+        executor.assert_called_once_with(max_workers=10)
+
+
+class MainTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name).resolve()
+        self.summary_path = self.tmp / "summary.md"
+        patcher = mock.patch.object(mobsf_ci, "_STEP_SUMMARY_PATH", self.summary_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_per_binary_summary(self) -> None:
+        apk, ipa = self.tmp / "a.apk", self.tmp / "b.ipa"
+        results = {apk: _result(3), ipa: _result(2, failed=1)}
+        with mock.patch.object(mobsf_ci, "run_masvs_audit_batch", return_value=results) as batch:
+            exit_code = mobsf_ci.main(["--app", str(apk), "--app", str(ipa), "--output", str(self.tmp / "masvs.json"), "--max-workers", "2"])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(batch.call_args.args[0], [apk, ipa])
+        self.assertEqual(batch.call_args.kwargs["max_workers"], 2)
+        self.assertEqual(
+            self.summary_path.read_text(encoding="utf-8"),
+            "\n".join(
+                [
+                    "## MobSF MASVS scan",
+                    "- Status: ⚠️ Completed with warnings",
+                    "- MASVS level: L2",
+                    "- `a.apk`: 3 passed, 0 failed",
+                    f"  - Report: `{self.tmp / 'masvs-a.apk.json'}`",
+                    "- `b.ipa`: 2 passed, 1 failed",
+                    f"  - Report: `{self.tmp / 'masvs-b.ipa.json'}`",
+                ]
+            )
+            + "\n",
+        )
+
+    def test_error_summary(self) -> None:
+        error = mobsf_ci.MobSFError("MobSF audit failed for 1 of 2 binaries; a.apk: Scan failed")
+        with mock.patch.object(mobsf_ci, "run_masvs_audit_batch", side_effect=error), contextlib.redirect_stderr(io.StringIO()):
+            exit_code = mobsf_ci.main(["--app", "a.apk", "--app", "b.ipa"])
+        self.assertEqual(exit_code, 1)
+        self.assertIn(f"- Error: {error}", self.summary_path.read_text(encoding="utf-8"))
+
+    def test_rejects_non_positive_max_workers(self) -> None:
+        for value in ("0", "-1", "many"):
+            with self.subTest(value=value), self.assertRaises(SystemExit) as ctx, contextlib.redirect_stderr(io.StringIO()):
+                mobsf_ci.parse_args(["--app", "a.apk", "--max-workers", value])
+            self.assertEqual(ctx.exception.code, 2)
+
+
+class AppendStepSummaryTests(unittest.TestCase):
+    def test_appends_single_trailing_newline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            summary_path = Path(tmp) / "summary.md"
+            with mock.patch.object(mobsf_ci, "_STEP_SUMMARY_PATH", summary_path):
+                mobsf_ci._append_step_summary("## First")
+                mobsf_ci._append_step_summary("## Second\n")
+                mobsf_ci._append_step_summary("")
+            self.assertEqual(summary_path.read_text(encoding="utf-8"), "## First\n## Second\n")
+
+    def test_single_write_per_summary(self) -> None:
+        handle = io.StringIO()
+        summary_path = mock.Mock()
+        summary_path.open.return_value.__enter__ = mock.Mock(return_value=mock.Mock(wraps=handle))
+        summary_path.open.return_value.__exit__ = mock.Mock(return_value=False)
+        with mock.patch.object(mobsf_ci, "_STEP_SUMMARY_PATH", summary_path):
+            mobsf_ci._append_step_summary("## Summary")
+        summary_path.open.assert_called_once_with("a", encoding="utf-8")
+        summary_path.open.return_value.__enter__.return_value.write.assert_called_once_with("## Summary\n")
+
+    def test_without_summary_path(self) -> None:
+        with mock.patch.object(mobsf_ci, "_STEP_SUMMARY_PATH", None), mock.patch("pathlib.Path.open") as open_mock:
+            mobsf_ci._append_step_summary("## Ignored")
+        open_mock.assert_not_called()
+
+    def test_unwritable_summary_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(mobsf_ci, "_STEP_SUMMARY_PATH", Path(tmp)):
+            mobsf_ci._append_step_summary("## Directory, not a file")
+
+
+if __name__ == "__main__":
+    unittest.main()